@@ -916,13 +916,13 @@ class Simulator:
             assert not self.coalescing_segments_only
         self.pedigree = None
         self.segment_stack = []
-        self.segments = [None for j in range(self.max_segments + 1)]
+        self.segments = [None] * (self.max_segments + 1)
         for j in range(self.max_segments):
             s = Segment(j + 1)
             self.segments[j + 1] = s
             self.segment_stack.append(s)
         self.hull_stack = []
-        self.hulls = [None for _ in range(self.max_segments + 1)]
+        self.hulls = [None] * (self.max_segments + 1)
         for j in range(self.max_segments):
             h = Hull(j + 1)
             self.hulls[j + 1] = h
@@ -1002,9 +1002,9 @@ class Simulator:
         # Note: this is done slightly differently to the C code, which
         # stores the root segments so that we can implement sampling
         # events easily.
-        root_segments_head = [None for _ in range(ts.num_nodes)]
-        root_segments_tail = [None for _ in range(ts.num_nodes)]
-        root_lineages = [None for _ in range(ts.num_nodes)]
+        root_segments_head = [None] * ts.num_nodes
+        root_segments_tail = [None] * ts.num_nodes
+        root_lineages = [None] * ts.num_nodes
         last_S = -1
         start_time = np.inf
         for tree in ts.trees():
@@ -73,9 +73,10 @@ def log_mutation_likelihood(ts, mutation_rate):
     """
     tables = ts.tables
     time = tables.nodes.time
-    total_material = 0
-    for e in tables.edges:
-        total_material += (e.right - e.left) * (time[e.parent] - time[e.child])
+    edges = tables.edges
+    total_material = np.sum(
+        (edges.right - edges.left) * (time[edges.parent] - time[edges.child])
+    )
     number_of_mutations = len(tables.mutations)
     if mutation_rate == 0:
         if number_of_mutations == 0:
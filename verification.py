@@ -387,7 +387,7 @@ class MsTest(Test):
         ca_events = [0 for j in range(replicates)]
         re_events = [0 for j in range(replicates)]
         gc_events = [0 for j in range(replicates)]
-        mig_events = [None for j in range(replicates)]
+        mig_events = [None] * replicates
         breakpoints = [[] for j in range(replicates)]
         for j in range(replicates):
             sim.reset()
@@ -2868,8 +2868,8 @@ class KnownSFS(Test):
 
     def compare_sfs(self, sample_size, ploidy, model, num_replicates, sfs, name):
         data = collections.defaultdict(list)
-        tbl_sum = [0] * (sample_size - 1)
-        tot_bl_sum = [0]
+        tbl_sum = np.zeros(sample_size - 1)
+        tot_bl_sum = 0.0
         replicates = msprime.sim_ancestry(
             [msprime.SampleSet(sample_size, ploidy=1, population=0)],
             ploidy=ploidy,
@@ -2877,21 +2877,28 @@ class KnownSFS(Test):
             num_replicates=num_replicates,
         )
         for ts in replicates:
+            node_time = ts.tables.nodes.time
+            samples = ts.samples()
             for tree in ts.trees():
-                tot_bl = 0.0
-                tbl = [0] * (sample_size - 1)
-                for node in tree.nodes():
-                    if tree.parent(node) != tskit.NULL:
-                        tbl[tree.num_samples(node) - 1] = tbl[
-                            tree.num_samples(node) - 1
-                        ] + tree.branch_length(node)
-                        tot_bl = tot_bl + tree.branch_length(node)
-
-                for xi in range(sample_size - 1):
-                    rescaled_x = tbl[xi]
-                    data["total_branch_length"].append(rescaled_x / tot_bl)
-                    tbl_sum[xi] = tbl_sum[xi] + rescaled_x
-                tot_bl_sum[0] = tot_bl_sum[0] + tot_bl
+                # Work on per-tree arrays rather than making a method call
+                # per node: one vectorized subtraction gives all branch
+                # lengths, and a single postorder pass gives the number of
+                # samples subtended by each node.
+                parent = tree.parent_array[: ts.num_nodes]
+                has_parent = parent != tskit.NULL
+                blen = np.where(has_parent, node_time[parent] - node_time, 0)
+                num_samples = np.zeros(ts.num_nodes, dtype=int)
+                num_samples[samples] = 1
+                for node in tree.postorder():
+                    if has_parent[node]:
+                        num_samples[parent[node]] += num_samples[node]
+                tbl = np.zeros(sample_size - 1)
+                np.add.at(tbl, num_samples[has_parent] - 1, blen[has_parent])
+                tot_bl = blen.sum()
+
+                data["total_branch_length"].extend(tbl / tot_bl)
+                tbl_sum += tbl
+                tot_bl_sum += tot_bl
                 data["num_leaves"].extend(range(1, sample_size))
 
         f = self.output_dir / f"{name}.png"
@@ -2902,7 +2909,7 @@ class KnownSFS(Test):
         l1 = ax.plot(np.arange(sample_size - 1), sfs[::], ":", linewidth=3, marker="^")
         l2 = ax.plot(
             np.arange(sample_size - 1),
-            [(x / num_replicates) / (tot_bl_sum[0] / num_replicates) for x in tbl_sum],
+            (tbl_sum / num_replicates) / (tot_bl_sum / num_replicates),
             "--",
             marker="o",
             linewidth=2,
@@ -3850,19 +3857,26 @@ class HudsonAnalytical(Test):
                     model=model,
                 )
                 for ts in replicates:
-                    firstroot = ts.first().root
-                    lastroot = ts.last().root
-                    for tree in ts.trees():
-                        left, right = tree.interval
-                        if left <= seq_length / 2 < right:
-                            midroot = tree.root
-                    for tree in ts.trees():
-                        left, right = map(int, tree.interval)
-                        if firstroot == tree.root:
+                    # A single pass over the trees records each interval and
+                    # root; the three root comparisons then run over that
+                    # list without decoding the trees a second time (or
+                    # rebuilding the first and last trees separately).
+                    tree_roots = [
+                        (*map(int, tree.interval), tree.root) for tree in ts.trees()
+                    ]
+                    firstroot = tree_roots[0][2]
+                    lastroot = tree_roots[-1][2]
+                    midroot = next(
+                        root
+                        for left, right, root in tree_roots
+                        if left <= seq_length / 2 < right
+                    )
+                    for left, right, root in tree_roots:
+                        if firstroot == root:
                             same_root_count_first[left:right] += 1
-                        if lastroot == tree.root:
+                        if lastroot == root:
                             same_root_count_last[left:right] += 1
-                        if midroot == tree.root:
+                        if midroot == root:
                             same_root_count_mid[left:right] += 1
                 empirical_prob_first[j, k, :] = same_root_count_first / R
                 empirical_prob_last[j, k, :] = same_root_count_last / R
@@ -5907,9 +5921,7 @@ class MutationStatsTest(Test):
 
     def verify_transitions(self, ts, model, discrete_genome, mutation_rate):
         observed = self.count_transitions(ts, model)
-        expected = np.zeros(observed.shape)
-        for j, (row, p) in enumerate(zip(observed, model.transition_matrix)):
-            expected[j, :] = sum(row) * p
+        expected = observed.sum(axis=1, keepdims=True) * model.transition_matrix
         return observed, expected
 
     def verify_roots(self, ts, model, discrete_genome, mutation_rate):
@@ -5950,18 +5962,20 @@ class MutationStatsTest(Test):
         return observed, expected
 
     def verify_mutation_times(self, ts):
-        start_time = np.full(ts.num_mutations, -1, dtype=np.float32)
+        # Work from the table columns directly: the node and mutation times
+        # come out as single array lookups, and only the (tree dependent)
+        # parent of the mutated node needs the per-tree loop.
+        node_time = ts.tables.nodes.time
+        mutations = ts.tables.mutations
+        mut_time = mutations.time.astype(np.float32)
+        start_time = node_time[mutations.node].astype(np.float32)
         end_time = np.full(ts.num_mutations, -1, dtype=np.float32)
-        mut_time = np.full(ts.num_mutations, -1, dtype=np.float32)
         for t in ts.trees():
+            parent = t.parent_array
             for mut in t.mutations():
-                mut_time[mut.id] = mut.time
-                end_time[mut.id] = t.time(t.parent(mut.node))
-                start_time[mut.id] = t.time(mut.node)
+                end_time[mut.id] = node_time[parent[mut.node]]
                 if mut.parent != tskit.NULL:
-                    end_time[mut.id] = min(
-                        end_time[mut.id], ts.mutation(mut.parent).time
-                    )
+                    end_time[mut.id] = min(end_time[mut.id], mut_time[mut.parent])
                     start_time[mut.parent] = max(start_time[mut.parent], mut.time)
         return (mut_time - start_time) / (end_time - start_time)
 
@@ -6197,18 +6211,25 @@ class MutationTest(Test):
 
     def _transitions(self, sequences, ts, alleles, mutation_rate, Q):
         num_alleles = len(alleles)
+        allele_index = {allele: j for j, allele in enumerate(alleles)}
         transitions = np.zeros((num_alleles, num_alleles), dtype=int)
         expected = np.zeros((num_alleles, num_alleles))
 
+        seq_len = int(ts.sequence_length)
+        tree = ts.first()
+        scaled_Q = mutation_rate * Q
         for edge in ts.edges():
-            for idx in range(int(ts.sequence_length)):
-                p = sequences[edge.parent][idx]
-                c = sequences[edge.child][idx]
-                transitions[alleles.index(p), alleles.index(c)] += 1
-                j = alleles.index(p)
-                expected[j, :] += _matrix_exponential(
-                    ts.first().branch_length(edge.child) * mutation_rate * Q
-                )[j, :]
+            parent_seq = sequences[edge.parent]
+            child_seq = sequences[edge.child]
+            # The transition probabilities only depend on the edge, not on
+            # the position along it.
+            transition_probs = _matrix_exponential(
+                tree.branch_length(edge.child) * scaled_Q
+            )
+            for idx in range(seq_len):
+                j = allele_index[parent_seq[idx]]
+                transitions[j, allele_index[child_seq[idx]]] += 1
+                expected[j, :] += transition_probs[j, :]
 
         return (transitions, expected)
 
@@ -6221,6 +6242,7 @@ class MutationTest(Test):
 
     def get_transition_stats(self, ts, alleles, mutation_rate, Q):
         num_alleles = len(alleles)
+        allele_index = {allele: j for j, allele in enumerate(alleles)}
         observed_transitions_ts = np.zeros((num_alleles, num_alleles))
         expected_ts = np.zeros((num_alleles, num_alleles))
 
@@ -6229,19 +6251,29 @@ class MutationTest(Test):
         # at least one  mutation on each site
         assert ts.num_trees == 1
         tree = ts.first()
+        # The tree is static across variants, so materialise the node list
+        # and parent lookups once rather than once per variant. The
+        # preorder traversal comes back as a ready-made array, avoiding the
+        # Python-level generator protocol of tree.nodes().
+        parent_array = tree.parent_array
+        node_parents = [(n, parent_array[n]) for n in tree.preorder()]
+        # The matrix exponential depends only on the node's branch length,
+        # so compute it once per node rather than once per (variant, node).
+        scaled_Q = mutation_rate * corr * Q
+        transition_probs = {
+            n: _matrix_exponential(tree.branch_length(n) * scaled_Q)
+            for n, _ in node_parents
+        }
         for v in ts.variants(samples=range(ts.num_nodes), isolated_as_missing=False):
-            for n in tree.nodes():
-                pn = tree.parent(n)
+            for n, pn in node_parents:
                 if pn != tskit.NULL:
                     pa = v.alleles[v.genotypes[pn]]
                 else:
                     pa = v.site.ancestral_state
                 da = v.alleles[v.genotypes[n]]
-                observed_transitions_ts[alleles.index(pa), alleles.index(da)] += 1
-                j = alleles.index(pa)
-                expected_ts[j, :] += _matrix_exponential(
-                    tree.branch_length(n) * mutation_rate * corr * Q
-                )[j, :]
+                j = allele_index[pa]
+                observed_transitions_ts[j, allele_index[da]] += 1
+                expected_ts[j, :] += transition_probs[n][j, :]
         return observed_transitions_ts, expected_ts
 
     def plot_stats(self, df_test, df_msprime, alleles, test_prog, model):